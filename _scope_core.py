@@ -0,0 +1,349 @@
+"""
+Logique partagée d'analyse de scope (pure Python, sans dépendance SDK).
+
+Importée à la fois par scope_validator (version standalone) et par
+integration_specialist_tool (custom tool SDK) : une seule copie de
+ScopeViolationError, des constantes et de l'analyse, compilée une seule fois.
+"""
+
+import functools
+import itertools
+import re
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+class ScopeViolationError(Exception):
+    """
+    Exception levée quand les limites de scope sont dépassées.
+
+    Construite avec un message explicite, ou via from_files(): le message n'est
+    alors formaté qu'à la demande (__str__), un appelant qui ne lit que
+    file_count/max_allowed ne paie pas le formatage. Dans ce cas args[0] vaut
+    None: lire le message via str(e) (repr(e) l'inclut aussi).
+    """
+
+    def __init__(self, message: Optional[str], file_count: int, max_allowed: int):
+        self.file_count = file_count
+        self.max_allowed = max_allowed
+        self.files_preview: Tuple[str, ...] = ()
+        # args reprend les arguments du constructeur (args[0]: message explicite,
+        # None si from_files) et l'exception reste picklable (files_preview suit
+        # via __dict__)
+        super().__init__(message, file_count, max_allowed)
+
+    @classmethod
+    def from_files(cls, files: Iterable[str], file_count: int, max_allowed: int) -> "ScopeViolationError":
+        """Exception au message formaté paresseusement à partir des fichiers."""
+        error = cls(None, file_count, max_allowed)
+        # Seuls les 5 premiers fichiers sont conservés pour le message
+        error.files_preview = tuple(itertools.islice(files, 5))
+        return error
+
+    def __str__(self) -> str:
+        message = self.args[0]
+        if message is not None:
+            return message
+        return (
+            f"Scope limit exceeded: {self.file_count} files requested (max: {self.max_allowed})\n"
+            f"Recommendation: Break this change into smaller, focused tasks\n"
+            f"Files: {', '.join(self.files_preview)}{'...' if self.file_count > 5 else ''}"
+        )
+
+    def __repr__(self) -> str:
+        # Construit depuis __str__: le message apparaît même quand args[0] est None
+        return f"{type(self).__name__}({str(self)!r}, {self.file_count!r}, {self.max_allowed!r})"
+
+
+# Fichiers infrastructure à surveiller
+INFRASTRUCTURE_FILES: FrozenSet[str] = frozenset({
+    'Dockerfile',
+    'docker-compose.yml',
+    'docker-compose.yaml',
+    'nginx.conf',
+    '.k8s/',
+    'kubernetes/',
+    'terraform/',
+    '.tf',
+    '.github/workflows/',
+    'Jenkinsfile',
+    '.circleci/',
+})
+
+# Automate unique (alternation compilée) : un seul scan par chemin pour tous les marqueurs
+_INFRA_RE = re.compile('|'.join(map(re.escape, sorted(INFRASTRUCTURE_FILES))))
+
+# Marqueurs qui sont des noms de fichiers complets (Dockerfile, nginx.conf...):
+# un lookup O(1) sur le basename suffit pour la plupart des hits, la regex ne
+# sert qu'aux autres chemins (répertoires comme .k8s/, extension .tf)
+_EXACT_INFRA: FrozenSet[str] = frozenset(
+    marker for marker in INFRASTRUCTURE_FILES
+    if '/' not in marker and not marker.startswith('.')
+)
+
+# Les chemins sont concaténés avec NUL (impossible dans un chemin) pour extraire
+# tous les répertoires top-level (avant le 1er '/') en un seul appel regex
+_PATH_SEP = '\0'
+_TOP_DIR_RE = re.compile(
+    r'(?:\A|' + re.escape(_PATH_SEP) + r')([^/' + re.escape(_PATH_SEP) + r']*)/'
+)
+
+# Catégories de chemins en une seule regex à groupes nommés: un seul match() par
+# chemin, m.lastgroup donne la catégorie. L'ordre des alternatives fixe la
+# priorité (infra prime, ex: terraform/ui.css reste de l'infrastructure)
+_CATEGORY_RE = re.compile(
+    r'(?P<infra>.*?(?:' + _INFRA_RE.pattern + r'))'
+    r'|(?P<ui>.*\.(?:css|scss|sass|less|html?)\Z)'
+    r'|(?P<config>(?:.*/)?(?:package\.json|\.env(?:\.[^/]*)?)\Z)'
+    r'|(?P<js>.*\.(?:js|jsx|ts|tsx)\Z)',
+    re.DOTALL
+)
+
+# Mots-clés de description (cherchés en début de mot, pas n'importe où dans un mot)
+_UI_KWS: FrozenSet[str] = frozenset({'ui', 'css', 'style', 'button', 'layout'})
+_COMPLEX_KWS: FrozenSet[str] = frozenset({'factory', 'manager', 'handler', 'builder', 'strategy', 'adapter'})
+_SIMPLE_KWS: FrozenSet[str] = frozenset({'fix', 'bug', 'typo', 'minor'})
+
+# Scope levels qui ajoutent un warning en tête de liste
+_WARN_SCOPE_LEVELS: FrozenSet[str] = frozenset({'MODERATE', 'EXTENSIVE'})
+
+# Une seule regex pour toutes les catégories: m.lastgroup donne la catégorie.
+# Le lookbehind ancre chaque mot-clé en début de mot ("lifestyle" ne matche pas
+# "style") sans exiger la fin du mot: pluriels et dérivés restent détectés
+# ("buttons", "fixes", "bugfix", "handlers"). Une transition camelCase compte
+# comme un début de mot, comme dans le scan par sous-chaîne d'origine:
+# "StrategyFactory" donne strategy et factory. La casse n'est ignorée que sur
+# les mots-clés, le lookbehind lit la description telle quelle.
+# Les guillemets/échappements shell (ex: description passée telle quelle par le
+# bridge SDK) ne sont pas des lettres et n'empêchent donc pas le match;
+# shlex.split n'est pas utilisé car il lève ValueError sur une apostrophe isolée.
+_KW_RE = re.compile(
+    r'(?:(?<![A-Za-z])|(?<=[a-z])(?=[A-Z]))(?i:'
+    + '|'.join(
+        f"(?P<{category}>{'|'.join(sorted(keywords))})"
+        for category, keywords in (('ui', _UI_KWS), ('complex', _COMPLEX_KWS), ('simple', _SIMPLE_KWS))
+    )
+    + r')'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_path(path: str) -> str:
+    """Catégorie d'un chemin (voir _CATEGORY_RE), mémoïsée par chemin."""
+    if path.rpartition('/')[2] in _EXACT_INFRA:
+        return 'infra'
+    match = _CATEGORY_RE.match(path)
+    return match.lastgroup if match else 'other'
+
+
+def classify_paths(paths: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Classe chaque chemin par catégorie: 'infra', 'ui', 'config', 'js' ou 'other'.
+
+    Le cache est par chemin: un même fichier présent dans plusieurs analyses
+    (ex: Dockerfile, Button.css) n'est classé qu'une seule fois.
+    """
+    return tuple(map(_classify_path, paths))
+
+
+def detect_anti_patterns(files: List[str], description: str) -> List[str]:
+    """
+    Détecte les anti-patterns documentés dans Learning 2025-01-22.
+
+    Anti-patterns détectés:
+    1. Infrastructure files modifiés pour problèmes UI/CSS
+    2. Changements dans >3 modules non-reliés
+    3. Abstractions complexes pour fixes simples (via description)
+
+    Args:
+        files: Liste des fichiers à modifier
+        description: Description du changement
+
+    Returns:
+        Liste des warnings détectés (nouvelle liste à chaque appel, l'analyse
+        elle-même est mise en cache sur (files, description))
+    """
+    return [message for _, message in _detect_anti_patterns(tuple(files), description)]
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_anti_patterns(files: Tuple[str, ...], description: str) -> Tuple[Tuple[str, str], ...]:
+    """Implémentation mémoïsée: tuple de paires (code, message) immuable."""
+    warnings = []
+
+    # Un seul passage sur la description pour les trois catégories de mots-clés
+    keywords_found = {}
+    for match in _KW_RE.finditer(description):
+        keywords_found.setdefault(match.lastgroup, set()).add(match.group().lower())
+
+    # Check 1: Infrastructure pour UI issue
+    if 'ui' in keywords_found:
+        infra_found = [f for f, category in zip(files, classify_paths(files)) if category == 'infra']
+        if infra_found:
+            warnings.append((
+                'ANTI_PATTERN_INFRA_UI',
+                f"⚠️ ANTI-PATTERN: Infrastructure files modified for UI issue!\n"
+                f"   Files: {', '.join(infra_found)}\n"
+                f"   Recommendation: Keep infrastructure changes separate from UI fixes"
+            ))
+
+    # Check 2: Modules non-reliés (>3 top-level directories)
+    top_dirs = set(_TOP_DIR_RE.findall(_PATH_SEP.join(files)))
+
+    if len(top_dirs) > 3:
+        warnings.append((
+            'ANTI_PATTERN_UNRELATED_MODULES',
+            f"⚠️ ANTI-PATTERN: Changes span {len(top_dirs)} unrelated modules: {', '.join(sorted(top_dirs))}\n"
+            f"   Recommendation: Split into focused changes per module"
+        ))
+
+    # Check 3: Abstractions complexes pour fixes simples
+    complexity_found = keywords_found.get('complex')
+
+    if complexity_found and 'simple' in keywords_found:
+        warnings.append((
+            'ANTI_PATTERN_COMPLEX_ABSTRACTION',
+            f"⚠️ ANTI-PATTERN: Complex abstractions ({sorted(complexity_found)}) for simple fix\n"
+            f"   Recommendation: Use simplest solution that works"
+        ))
+
+    return tuple(warnings)
+
+
+def _analyze_scope_impl(files: Sequence[str], description: str) -> Dict:
+    """
+    Analyse si les changements proposés respectent les limites de scope.
+
+    Implémentation unique, exposée comme scope_validator.analyze_scope et
+    integration_specialist_tool.analyze_integration_scope_sync.
+
+    Limites enforced:
+    - LOCAL (1-3 fichiers): Auto-approve
+    - MODERATE (4-5 fichiers): Approve avec warning
+    - EXTENSIVE (6-10 fichiers): Approve avec strong warning
+    - SYSTEMIC (>10 fichiers): BLOCKED via exception
+
+    Args:
+        files: Fichiers à modifier (list ou tuple; un tuple est utilisé tel quel
+            comme clé du cache d'analyse)
+        description: Description du changement proposé (non utilisée si >10
+            fichiers: le blocage ne dépend que du nombre de fichiers)
+
+    Returns:
+        dict avec:
+        - approved (bool): Si le changement est approuvé
+        - scope_level (str): LOCAL/MODERATE/EXTENSIVE
+        - file_count (int): Nombre de fichiers
+        - warnings (list): Warnings détectés (anti-patterns uniquement si une
+          description est fournie)
+        - warning_codes (frozenset): Codes stables des warnings, pour dispatcher
+          sans parser les messages: SCOPE_MODERATE, SCOPE_EXTENSIVE,
+          ANTI_PATTERN_INFRA_UI, ANTI_PATTERN_UNRELATED_MODULES,
+          ANTI_PATTERN_COMPLEX_ABSTRACTION
+
+    Raises:
+        ScopeViolationError: Si >10 fichiers (limite absolue)
+    """
+    file_count = len(files)
+
+    # Enforcement absolu: >10 fichiers = BLOCKED
+    if file_count > 10:
+        raise ScopeViolationError.from_files(
+            files,
+            file_count=file_count,
+            max_allowed=10
+        )
+
+    # Fast path: ≤3 fichiers sans description → aucun anti-pattern possible
+    # (les checks 1 et 3 portent sur la description, le check 2 exige >3 fichiers)
+    if file_count <= 3 and not description.strip():
+        return {
+            "approved": True,
+            "scope_level": "LOCAL",
+            "file_count": file_count,
+            "warnings": [],
+            "warning_codes": frozenset(),
+            "files": files
+        }
+
+    # Résultat mémoïsé; le dict et la liste de warnings sont recréés à chaque
+    # appel pour que l'appelant ne puisse pas modifier l'entrée du cache.
+    # Chemins internés: les comparaisons de clés (ici et dans le cache de
+    # _classify_path) se résolvent par identité pour les chemins déjà vus.
+    # sys.intern refuse les sous-classes de str (StrEnum...): gardées telles quelles
+    scope_level, warnings, warning_codes = _analyze_scope_cached(
+        tuple(sys.intern(f) if type(f) is str else f for f in files), description
+    )
+
+    return {
+        "approved": True,
+        "scope_level": scope_level,
+        "file_count": file_count,
+        "warnings": list(warnings),
+        "warning_codes": warning_codes,
+        "files": files
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_scope_cached(
+    files: Tuple[str, ...], description: str
+) -> Tuple[str, Tuple[str, ...], FrozenSet[str]]:
+    """
+    Scope level, messages et codes de warnings pour des entrées déjà validées
+    (≤10 fichiers).
+
+    Le chemin bloqué (>10 fichiers) n'est jamais mis en cache: il est O(1) et
+    relever une même instance d'exception accumulerait les tracebacks.
+    """
+    file_count = len(files)
+
+    # Déterminer scope level
+    if file_count <= 3:
+        scope_level = "LOCAL"
+        scope_message = "✅ Local scope - auto-approved"
+    elif file_count <= 5:
+        scope_level = "MODERATE"
+        scope_message = "⚠️ Moderate scope - approved with caution"
+    else:  # 6-10
+        scope_level = "EXTENSIVE"
+        scope_message = "⚠️ Extensive scope - approaching limit (max 10 files)"
+
+    # Détection anti-patterns
+    warnings = _detect_anti_patterns(files, description)
+
+    # Warning additionnel si scope élevé
+    if scope_level in _WARN_SCOPE_LEVELS:
+        warnings = ((f"SCOPE_{scope_level}", scope_message),) + warnings
+
+    return (
+        scope_level,
+        tuple(message for _, message in warnings),
+        frozenset(code for code, _ in warnings),
+    )
+
+
+def analyze_scope_batch(
+    cases: Iterable[Tuple[Sequence[str], str]]
+) -> List[Union[Dict, ScopeViolationError]]:
+    """
+    Analyse plusieurs changements (files, description) en un seul appel.
+
+    Les cas partagent les caches de classification et d'analyse. Un cas bloqué
+    ne stoppe pas le batch: son ScopeViolationError est retourné à sa place
+    dans la liste (même principe que asyncio.gather(return_exceptions=True)).
+
+    Args:
+        cases: Itérable de tuples (files, description)
+
+    Returns:
+        Liste, dans l'ordre des cas, du dict de _analyze_scope_impl ou de
+        l'exception ScopeViolationError levée
+    """
+    results = []
+    for files, description in cases:
+        try:
+            results.append(_analyze_scope_impl(files, description))
+        except ScopeViolationError as e:
+            results.append(e)
+    return results
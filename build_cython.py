@@ -0,0 +1,33 @@
+"""
+Build optionnel: compile _scope_core.py en extension C via Cython.
+
+    pip install cython setuptools
+    python build_cython.py build_ext --inplace
+
+L'extension compilée (_scope_core.*.so) est importée en priorité sur le .py.
+Sans elle, Python charge simplement _scope_core.py - même code, même
+comportement, aucune dépendance requise à l'exécution.
+
+Après toute modification de _scope_core.py, supprimer l'extension
+(rm _scope_core.*.so) ou relancer ce build: sinon l'ancienne version
+compilée continue d'être importée à la place du .py modifié.
+
+Ce script ne sert qu'à ce build: le projet n'est pas un package installable
+(pas de pip install .), les scripts s'exécutent depuis le répertoire.
+"""
+
+import sys
+
+try:
+    from Cython.Build import cythonize
+    from setuptools import setup
+except ImportError:
+    sys.exit("build_cython.py requires Cython and setuptools: pip install cython setuptools")
+
+setup(
+    name="integration-specialist-scope",
+    ext_modules=cythonize(
+        ["_scope_core.py"],
+        compiler_directives={"language_level": "3"},
+    ),
+)
@@ -4,6 +4,10 @@ Script CLI pour valider le scope avant modifications.
 
 Usage:
     python check_scope.py <file1> <file2> ... -- "description"
+    python check_scope.py <file1> <file2> ... -d "description"
+
+Avec "--", tout ce qui précède est un fichier, même un chemin commençant par
+"-" (ex: -x.css); -d n'y est pas accepté.
 
 Exit codes:
     0: Scope approved
@@ -14,68 +18,92 @@ Example:
     python check_scope.py src/app.css src/theme.css -- "Fix button styling"
 """
 
+import argparse
 import sys
-from integration_specialist_tool import (
-    analyze_integration_scope_sync,
+# Import direct de la logique partagée: le CLI ne charge jamais claude_agent_sdk
+from _scope_core import (
+    _analyze_scope_impl,
     ScopeViolationError
 )
 
+_BAR = '=' * 80
 
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: check_scope.py <file1> <file2> ... -- \"description\"", file=sys.stderr)
-        print("\nExample:", file=sys.stderr)
-        print('  check_scope.py src/a.css src/b.css -- "Fix CSS"', file=sys.stderr)
-        sys.exit(2)
 
-    # Parse args: everything before "--" is files, after is description
-    try:
-        separator_idx = sys.argv.index("--")
-        files = sys.argv[1:separator_idx]
-        description = " ".join(sys.argv[separator_idx + 1:])
-    except ValueError:
-        # No separator, assume last arg is description
-        files = sys.argv[1:-1]
-        description = sys.argv[-1]
+def _emit(stream, text):
+    """Écrit le rapport: en bytes UTF-8 d'un seul write hors TTY (CI, pre-commit)."""
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or stream.isatty():
+        stream.write(text)
+    else:
+        stream.flush()
+        buffer.write(text.encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Valide le scope d'un changement avant modifications.",
+        epilog='Example: check_scope.py src/a.css src/b.css -- "Fix CSS"',
+    )
+    parser.add_argument("files", nargs="+", help='fichiers à modifier, suivis de -- "description"')
+    parser.add_argument("-d", "--description", help="description du changement")
+
+    # Forme historique: tout ce qui suit le premier "--" est la description,
+    # même non quotée (argparse compterait ces mots comme des fichiers)
+    argv = sys.argv[1:]
+    if "--" in argv:
+        separator_idx = argv.index("--")
+        files_argv, tail = argv[:separator_idx], argv[separator_idx + 1:]
+        # Avant "--", tout argument est un fichier (même "-x.css"), sauf -d
+        if any(arg in ("-d", "--description") or arg.startswith("--description=") for arg in files_argv):
+            parser.error("use either -- or -d for the description, not both")
+        files = parser.parse_args(["--", *files_argv]).files
+        description = tail[0] if len(tail) == 1 else " ".join(tail)
+    else:
+        args = parser.parse_args(argv)
+        files, description = args.files, args.description
+        if description is None:
+            # Sans "--" ni -d, le dernier argument est la description
+            *files, description = files
 
     if not files:
-        print("Error: No files specified", file=sys.stderr)
-        sys.exit(2)
+        parser.error("no files specified")
 
     if not description:
-        print("Error: No description provided", file=sys.stderr)
-        sys.exit(2)
+        parser.error("no description provided")
 
     # Analyze scope
     try:
-        result = analyze_integration_scope_sync(files, description)
-
-        # Print result
-        print(f"\n{'='*80}")
-        print(f"SCOPE ANALYSIS")
-        print(f"{'='*80}")
-        print(f"Status: ✅ APPROVED")
-        print(f"Scope Level: {result['scope_level']}")
-        print(f"File Count: {result['file_count']}/{10}")
+        result = _analyze_scope_impl(files, description)
 
+        # Print result (une seule écriture)
         if result['warnings']:
-            print(f"\n⚠️  WARNINGS:")
-            for warning in result['warnings']:
-                print(f"  {warning}")
+            details = "\n⚠️  WARNINGS:\n" + "".join(f"  {warning}\n" for warning in result['warnings'])
         else:
-            print(f"\n✅ No warnings detected")
-
-        print(f"{'='*80}\n")
+            details = "\n✅ No warnings detected\n"
+        _emit(
+            sys.stdout,
+            f"\n{_BAR}\n"
+            f"SCOPE ANALYSIS\n"
+            f"{_BAR}\n"
+            f"Status: ✅ APPROVED\n"
+            f"Scope Level: {result['scope_level']}\n"
+            f"File Count: {result['file_count']}/{10}\n"
+            f"{details}"
+            f"{_BAR}\n\n"
+        )
         sys.exit(0)
 
     except ScopeViolationError as e:
-        print(f"\n{'='*80}", file=sys.stderr)
-        print(f"🚫 SCOPE VIOLATION - BLOCKED", file=sys.stderr)
-        print(f"{'='*80}", file=sys.stderr)
-        print(f"\n{str(e)}\n", file=sys.stderr)
-        print(f"File count: {e.file_count}", file=sys.stderr)
-        print(f"Max allowed: {e.max_allowed}", file=sys.stderr)
-        print(f"{'='*80}\n", file=sys.stderr)
+        _emit(
+            sys.stderr,
+            f"\n{_BAR}\n"
+            f"🚫 SCOPE VIOLATION - BLOCKED\n"
+            f"{_BAR}\n"
+            f"\n{e}\n\n"
+            f"File count: {e.file_count}\n"
+            f"Max allowed: {e.max_allowed}\n"
+            f"{_BAR}\n\n"
+        )
         sys.exit(1)
 
     except Exception as e:
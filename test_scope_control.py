@@ -16,6 +16,12 @@ from integration_specialist_tool import (
 )
 
 
+def _check(condition, message):
+    """Équivalent de assert qui n'est pas supprimé par `python -O`."""
+    if not condition:
+        raise AssertionError(message)
+
+
 def test_1_legitimate_css_fix():
     """Test 1: Changement légitime de 2 fichiers CSS - devrait passer sans friction."""
     print("\n" + "="*80)
@@ -31,18 +37,20 @@ def test_1_legitimate_css_fix():
     try:
         result = analyze_integration_scope_sync(files, description)
 
-        print(f"✅ Status: APPROVED")
-        print(f"   Scope Level: {result['scope_level']}")
-        print(f"   File Count: {result['file_count']}")
-        print(f"   Warnings: {len(result['warnings'])}")
+        print(
+            f"✅ Status: APPROVED\n"
+            f"   Scope Level: {result['scope_level']}\n"
+            f"   File Count: {result['file_count']}\n"
+            f"   Warnings: {len(result['warnings'])}"
+        )
 
         if result['warnings']:
             for warning in result['warnings']:
                 print(f"   {warning}")
 
-        assert result['approved'] == True
-        assert result['scope_level'] == "LOCAL"
-        assert result['file_count'] == 2
+        _check(result['approved'], "résultat non approuvé")
+        _check(result['scope_level'] == "LOCAL", f"scope_level inattendu: {result['scope_level']}")
+        _check(result['file_count'] == 2, f"file_count inattendu: {result['file_count']}")
         print("\n✅ TEST 1 PASSED: Changes légitimes approuvés sans friction")
 
     except Exception as e:
@@ -70,18 +78,21 @@ def test_2_moderate_scope_creep():
     try:
         result = analyze_integration_scope_sync(files, description)
 
-        print(f"⚠️  Status: APPROVED with WARNING")
-        print(f"   Scope Level: {result['scope_level']}")
-        print(f"   File Count: {result['file_count']}")
-        print(f"   Warnings: {len(result['warnings'])}")
+        print(
+            f"⚠️  Status: APPROVED with WARNING\n"
+            f"   Scope Level: {result['scope_level']}\n"
+            f"   File Count: {result['file_count']}\n"
+            f"   Warnings: {len(result['warnings'])}"
+        )
 
         for warning in result['warnings']:
             print(f"   {warning}")
 
-        assert result['approved'] == True
-        assert result['scope_level'] == "MODERATE"
-        assert result['file_count'] == 5
-        assert len(result['warnings']) > 0
+        _check(result['approved'], "résultat non approuvé")
+        _check(result['scope_level'] == "MODERATE", f"scope_level inattendu: {result['scope_level']}")
+        _check(result['file_count'] == 5, f"file_count inattendu: {result['file_count']}")
+        _check(result['warnings'], "aucun warning émis")
+        _check('SCOPE_MODERATE' in result['warning_codes'], f"codes inattendus: {sorted(result['warning_codes'])}")
         print("\n✅ TEST 2 PASSED: Scope modéré détecté avec warning approprié")
 
     except Exception as e:
@@ -121,14 +132,16 @@ def test_3_bulldozer_systemique():
         return False
 
     except ScopeViolationError as e:
-        print(f"🚫 Status: BLOCKED (exception levée)")
-        print(f"   Exception: {type(e).__name__}")
-        print(f"   Message: {str(e)}")
-        print(f"   File count: {e.file_count}")
-        print(f"   Max allowed: {e.max_allowed}")
-
-        assert e.file_count == 11
-        assert e.max_allowed == 10
+        print(
+            f"🚫 Status: BLOCKED (exception levée)\n"
+            f"   Exception: {type(e).__name__}\n"
+            f"   Message: {str(e)}\n"
+            f"   File count: {e.file_count}\n"
+            f"   Max allowed: {e.max_allowed}"
+        )
+
+        _check(e.file_count == 11, f"file_count inattendu: {e.file_count}")
+        _check(e.max_allowed == 10, f"max_allowed inattendu: {e.max_allowed}")
         print("\n✅ TEST 3 PASSED: Bulldozer Systémique bloqué via exception")
         print("   ✅ Le cas historique 2025-01-22 aurait été PRÉVENU")
         return True
@@ -154,20 +167,22 @@ def test_4_anti_pattern_infrastructure_ui():
     try:
         result = analyze_integration_scope_sync(files, description)
 
-        print(f"⚠️  Status: APPROVED but with ANTI-PATTERN WARNING")
-        print(f"   Scope Level: {result['scope_level']}")
-        print(f"   File Count: {result['file_count']}")
-        print(f"   Warnings: {len(result['warnings'])}")
+        print(
+            f"⚠️  Status: APPROVED but with ANTI-PATTERN WARNING\n"
+            f"   Scope Level: {result['scope_level']}\n"
+            f"   File Count: {result['file_count']}\n"
+            f"   Warnings: {len(result['warnings'])}"
+        )
 
-        # Vérifier qu'au moins un warning mentionne l'anti-pattern
-        anti_pattern_detected = any('ANTI-PATTERN' in w for w in result['warnings'])
+        # Vérifier que l'anti-pattern infrastructure+UI est signalé (code stable)
+        anti_pattern_detected = 'ANTI_PATTERN_INFRA_UI' in result['warning_codes']
 
         for warning in result['warnings']:
             print(f"   {warning}")
 
-        assert result['approved'] == True
-        assert result['scope_level'] == "LOCAL"
-        assert anti_pattern_detected == True
+        _check(result['approved'], "résultat non approuvé")
+        _check(result['scope_level'] == "LOCAL", f"scope_level inattendu: {result['scope_level']}")
+        _check(anti_pattern_detected, "anti-pattern infrastructure+UI non signalé")
         print("\n✅ TEST 4 PASSED: Anti-pattern infrastructure+UI détecté et signalé")
 
     except Exception as e:
@@ -198,15 +213,17 @@ def test_5_statistics():
         "note": "Statistics tracking not implemented in POC"
     }
 
-    print(f"📊 Statistics structure validated:")
-    print(f"   Total analyses: {stats['total_analyses']}")
-    print(f"   Average file count: {stats['average_file_count']}")
-    print(f"   Scope distribution: {stats['scope_distribution']}")
-    print(f"   Anti-patterns detected: {stats['anti_patterns_detected']}")
-    print(f"\n   Note: {stats['note']}")
-
-    assert 'total_analyses' in stats
-    assert 'scope_distribution' in stats
+    print(
+        f"📊 Statistics structure validated:\n"
+        f"   Total analyses: {stats['total_analyses']}\n"
+        f"   Average file count: {stats['average_file_count']}\n"
+        f"   Scope distribution: {stats['scope_distribution']}\n"
+        f"   Anti-patterns detected: {stats['anti_patterns_detected']}\n"
+        f"\n   Note: {stats['note']}"
+    )
+
+    _check('total_analyses' in stats, "clé total_analyses manquante")
+    _check('scope_distribution' in stats, "clé scope_distribution manquante")
     print("\n✅ TEST 5 PASSED: Statistics structure validated (implementation would require persistence)")
 
     return True